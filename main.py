@@ -1,15 +1,143 @@
-import json
+import atexit
+import bisect
 import logging as log
-import os.path
+import operator
+import os
+import queue
+import struct
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
 
-from win32api import GetSystemMetrics
+import numpy as np
 
-from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QPushButton, QLabel, QLineEdit, QTableWidget, \
-    QTableWidgetItem, QSpinBox, QDoubleSpinBox, QDialog, QMessageBox, QHBoxLayout
+# orjson ist deutlich schneller als das json-Modul der Standardbibliothek, ist aber optional
+try:
+    import orjson
 
-from matplotlib import pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    import json
+
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
+
+    json_loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QGuiApplication
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QPushButton, QLabel, QLineEdit, QTableView, \
+    QHeaderView, QSpinBox, QDoubleSpinBox, QDialog, QMessageBox, QHBoxLayout
+
+NOT_AVAILABLE = "N/A"  # Platzhalter für noch nicht vorhandene Werte
+IO_BUFFER_SIZE = 1 << 16  # Puffergröße für Dateizugriffe, damit Kursdateien mit wenigen Systemaufrufen gelesen werden
+
+
+def write_atomic(path, payload):
+    """
+    Schreibt die übergebenen Bytes atomar in eine Datei.
+
+    Die Daten werden zunächst in eine temporäre Datei geschrieben und anschließend
+    per `os.replace` über die Zieldatei verschoben. Ein Absturz während des Schreibens
+    hinterlässt dadurch nie eine halb geschriebene Datei.
+
+    Args:
+        path (str): Der Pfad der Zieldatei.
+        payload (bytes): Der zu schreibende Inhalt.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb", buffering=IO_BUFFER_SIZE) as file:
+        file.write(payload)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+
+# Zwischenspeicher für noch nicht geschriebene Daten. Änderungen markieren den Eintrag als "dirty",
+# geschrieben wird gesammelt durch _flush_if_dirty (per Timer und beim Beenden).
+_course_state = {'dirty': False, 'data': None}  # Kursliste als Liste von Dictionaries
+_config_state = {'dirty': False, 'data': None}  # Konfiguration im Binärformat
+_flush_lock = threading.Lock()  # Verhindert, dass zwei Threads gleichzeitig dieselbe Datei schreiben
+
+
+def _flush_if_dirty():
+    """
+    Schreibt Kurse und Konfiguration in ihre Dateien, falls sie seit dem letzten Schreiben geändert wurden.
+
+    Wird regelmäßig über `_schedule_flush` im Thread-Pool und beim Beenden der Anwendung aufgerufen.
+    Das Dirty-Flag wird vor dem Lesen der Daten zurückgesetzt, sodass eine gleichzeitige Änderung
+    spätestens beim nächsten Aufruf geschrieben wird. Schlägt das Schreiben fehl, wird das Flag
+    wieder gesetzt und der Fehler protokolliert, damit der nächste Aufruf es erneut versucht.
+    """
+    with _flush_lock:
+        if _course_state['dirty']:
+            _course_state['dirty'] = False
+            data = _course_state['data']
+            try:
+                write_atomic(CourseManager.FILE_PATH, json_dumps(data))
+                log.info("%d Kurse in Datei geschrieben.", len(data))
+            except OSError:
+                _course_state['dirty'] = True
+                log.exception("Kurse konnten nicht gespeichert werden.")
+        if _config_state['dirty']:
+            _config_state['dirty'] = False
+            try:
+                write_atomic(StudyConfig.CONFIG_FILE, _config_state['data'])
+                log.info("Konfiguration in Datei geschrieben.")
+            except OSError:
+                _config_state['dirty'] = True
+                log.exception("Konfiguration konnte nicht gespeichert werden.")
+
+
+def _schedule_flush():
+    """
+    Übergibt das Schreiben geänderter Daten an den globalen Thread-Pool, damit die Oberfläche
+    nicht auf die Festplatte warten muss.
+    """
+    if _course_state['dirty'] or _config_state['dirty']:
+        QThreadPool.globalInstance().start(FlushWorker())
+
+
+class CourseIOSignals(QObject):
+    """
+    Signale, über die Hintergrundaufgaben ihre Ergebnisse an die Oberfläche zurückgeben.
+    """
+    loaded = pyqtSignal(list)
+
+
+class CourseIOWorker(QRunnable):
+    """
+    Lädt die gespeicherten Kurse in einem Thread des Thread-Pools.
+
+    Das Ergebnis wird über `signals.loaded` an den GUI-Thread übergeben. Schlägt das Laden fehl,
+    wird eine leere Liste übergeben, damit die Oberfläche trotzdem bedienbar wird.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.signals = CourseIOSignals()
+
+    def run(self):
+        # Eine Ausnahme darf den Thread-Pool nicht verlassen, PyQt würde die Anwendung sonst beenden
+        try:
+            courses = CourseManager.load_courses()
+        except Exception:
+            log.exception("Kurse konnten nicht geladen werden.")
+            courses = []
+        self.signals.loaded.emit(courses)
+
+
+class FlushWorker(QRunnable):
+    """
+    Schreibt vorgemerkte Änderungen in einem Thread des Thread-Pools auf die Festplatte.
+    """
+
+    def run(self):
+        _flush_if_dirty()
 
 
 class StudyConfig:
@@ -17,36 +145,78 @@ class StudyConfig:
     Die Klasse StudyConfig verwaltet die Konfigurationsdaten für das Studium,
     einschließlich der Zielstudienzeit und der Zielnote.
 
-    Die Konfiguration wird in einer JSON-Datei gespeichert und geladen.
+    Die Konfiguration wird in einer Binärdatei fester Länge gespeichert und geladen.
     Falls keine Konfigurationsdatei existiert, wird der Benutzer aufgefordert,
     die Daten einzugeben.
     """
-    CONFIG_FILE = "save/config.json"
+    CONFIG_FILE = "save/config.bin"
+    LEGACY_CONFIG_FILE = "save/config.json"  # Konfigurationsdatei älterer Versionen, wird einmalig übernommen
+    CONFIG_FORMAT = struct.Struct("<id")  # Zielzeit (int) und Zielnote (double), 12 Bytes
+
+    _instance = None  # Die einzige Instanz der Konfiguration im Prozess
+    _loaded = False  # Wird gesetzt, sobald die Konfiguration einmal geladen wurde
+
+    def __new__(cls):
+        """
+        Liefert immer dieselbe Instanz zurück, damit die Konfiguration nur einmal pro Prozess
+        gelesen wird.
+        """
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
 
     def __init__(self):
         """
         Initialisiert die StudyConfig-Klasse mit Standardwerten und lädt die Konfiguration.
+
+        Bei wiederholtem Aufruf wird die bereits geladene Konfiguration unverändert weiterverwendet.
         """
+        if self._loaded:
+            return
         self.target_time = 0
         self.target_grade = 0.0
         self.load_config()
 
     def load_config(self):
         """
-        Lädt die Konfiguration aus der JSON-Datei.
-        Falls die Datei nicht existiert oder fehlerhaft ist, wird eine Benutzerabfrage gestartet.
+        Lädt die Konfiguration aus der Binärdatei.
+        Falls die Datei nicht existiert oder fehlerhaft ist, wird zunächst versucht, eine
+        JSON-Konfiguration älterer Versionen zu übernehmen. Gelingt auch das nicht, wird eine
+        Benutzerabfrage gestartet.
 
         Falls die Datei vorhanden ist, werden die Werte für Ziel-Studienzeit und Zielnote ausgelesen.
+        Die Datei wird nur beim ersten Aufruf gelesen.
+        """
+        if StudyConfig._loaded:
+            return
+        try:
+            with open(self.CONFIG_FILE, "rb", buffering=IO_BUFFER_SIZE) as file:
+                self.target_time, self.target_grade = self.CONFIG_FORMAT.unpack(file.read())
+            log.info("Konfiguration wurde erfoglreich geladen")
+        except (FileNotFoundError, struct.error):
+            if not self.migrate_legacy_config():
+                log.warning("Konfigurationsdatei nicht gefunden.")
+                self.ask_user_for_config()
+        StudyConfig._loaded = True
+
+    def migrate_legacy_config(self):
+        """
+        Übernimmt die Werte aus der JSON-Konfigurationsdatei älterer Versionen und speichert
+        sie im Binärformat.
+
+        Returns:
+            bool: True, wenn eine alte Konfiguration übernommen wurde, andernfalls False.
         """
         try:
-            with open(self.CONFIG_FILE, "r") as file:
-                data = json.load(file)
-                self.target_time = data.get("target_time", 0)
-                self.target_grade = data.get("target_grade", 0.0)
-                log.info("Konfiguration wurde erfoglreich geladen")
-        except (FileNotFoundError, json.JSONDecodeError):
-            log.warning("Konfigurationsdatei nicht gefunden.")
-            self.ask_user_for_config()
+            with open(self.LEGACY_CONFIG_FILE, "rb", buffering=IO_BUFFER_SIZE) as file:
+                data = json_loads(file.read())
+        except (FileNotFoundError, JSONDecodeError):
+            return False
+        self.target_time = data.get("target_time", 0)
+        self.target_grade = data.get("target_grade", 0.0)
+        self.save_config()
+        log.info("Konfiguration aus %s übernommen", self.LEGACY_CONFIG_FILE)
+        return True
 
     def ask_user_for_config(self):
         """
@@ -62,18 +232,16 @@ class StudyConfig:
 
     def save_config(self):
         """
-        Speichert die aktuellen Konfigurationswerte (Zielzeit und Zielnote) in die JSON-Datei.
-        Falls die Datei nicht existiert, wird sie erstellt.
+        Merkt die aktuellen Konfigurationswerte (Zielzeit und Zielnote) zum Speichern vor.
 
-        Ein Log-Eintrag wird geschrieben, um den erfolgreichen Speichervorgang zu dokumentieren.
+        Die Werte werden nur im Speicher im Binärformat abgelegt. `_flush_if_dirty` schreibt sie
+        später gesammelt in die Binärdatei und protokolliert erst dann das erfolgreiche Schreiben.
+        Die Werte der gemeinsamen Instanz bleiben dabei erhalten, ein erneutes Laden ist nicht nötig.
         """
-        with open(self.CONFIG_FILE, "w") as file:
-            json.dump({
-                "target_time": self.target_time,
-                "target_grade": self.target_grade
-            }, file)
-            log.info("Konfiguration gespeichert: %d Jahre, Zielnote %.2f", self.target_time,
-                     self.target_grade)
+        _config_state['data'] = self.CONFIG_FORMAT.pack(self.target_time, self.target_grade)
+        _config_state['dirty'] = True
+        log.info("Konfiguration zum Speichern vorgemerkt: %d Jahre, Zielnote %.2f", self.target_time,
+                 self.target_grade)
 
 
 class ConfigDialog(QDialog):
@@ -121,24 +289,44 @@ class Course:
     Ein Kurs enthält Informationen wie den Namen, die Anzahl der ECTS-Punkte,
     die erreichte Note, die angestrebte Note und das Semester, in dem er fällig ist.
     """
+    # Feste Attributliste statt __dict__, spart Speicher bei vielen Kursobjekten
+    __slots__ = ("name", "ects", "grade", "target_grade", "semester", "_cells")
 
-    def __init__(self, name, ects, grade, target_grade, semester):
+    def __init__(self, name, ects=1, grade=None, target_grade=0.0, semester=1):
         """
         Initialisiert ein neues Kursobjekt.
 
         Args:
             name (str): Der Name des Kurses.
-            ects (int): Die Anzahl der ECTS-Punkte des Kurses.
+            ects (int): Die Anzahl der ECTS-Punkte des Kurses. Ein Wert von 0 ist ungültig.
             grade (float or None): Die erreichte Note (falls bereits bewertet).
             target_grade (float): Die angestrebte Zielnote.
             semester (int): Das Semester, in dem der Kurs absolviert.
         """
         self.name = name
-        if ects != 0:  # ECTS sollte nicht null sein, daher eine Sicherheitsprüfung
-            self.ects = ects
+        self.ects = ects
         self.grade = grade  # Die tatsächlich erreichte Note (None, falls noch nicht bewertet)
         self.target_grade = target_grade  # Die angestrebte Zielnote für den Kurs
         self.semester = semester  # Das Semester, in dem der Kurs absolviert wird
+        # Zwischengespeicherte Anzeigetexte der Tabellenzellen, werden beim ersten Zugriff berechnet
+        self._cells = None
+
+    @property
+    def cells(self):
+        """
+        Liefert die Anzeigetexte des Kurses in der Reihenfolge der Tabellenspalten.
+
+        Die Texte werden nur einmal pro Kursobjekt erzeugt. Geänderte Kurse werden als neue
+        Objekte angelegt und bringen daher keinen veralteten Zwischenspeicher mit.
+
+        Returns:
+            tuple of str: Name, ECTS, Note (oder "N/A"), Zielnote und Semester.
+        """
+        cells = self._cells
+        if cells is None:
+            cells = self._cells = (self.name, str(self.ects), str(self.grade) if self.grade else NOT_AVAILABLE,
+                                   str(self.target_grade), str(self.semester))
+        return cells
 
     def is_completed(self):
         """
@@ -182,36 +370,63 @@ class CourseManager:
     """
     FILE_PATH = "save/courses.json"
 
+    _cache = None  # Zwischengespeicherte Kursliste, wird nur durch save_courses ersetzt
+    _last_hash = None  # Inhalts-Hash der zuletzt gelesenen oder geschriebenen Kursdatei
+
     @staticmethod
     def save_courses(courses, parent=None):
         """
-        Speichert die übergebenen Kurse in einer JSON-Datei.
+        Merkt die übergebenen Kurse zum Speichern in der JSON-Datei vor.
 
         Doppelte Kurse werden entfernt, basierend auf ihrem Namen. Falls doppelte Kurse
         erkannt werden, wird eine Warnung angezeigt.
 
+        Die Kurse werden nur im Speicher abgelegt. `_flush_if_dirty` schreibt sie später
+        gesammelt in die Datei.
+
         Args:
             courses (list of Course): Eine Liste von `Course`-Objekten.
             parent (QWidget, optional): Ein optionales Eltern-Widget für Meldungsfenster.
 
         Returns:
-            bool: True, wenn die Kurse erfolgreich gespeichert wurden, andernfalls False.
+            bool: True, wenn die Kurse vorgemerkt wurden oder unverändert sind, andernfalls False.
         """
 
-        # Erstelle ein Dictionary, um doppelte Kurse anhand des Namens zu eliminieren
-        existing_courses = {course.name: course for course in courses}
+        # Doppelte Kurse anhand des Namens erkennen, beim ersten Duplikat wird abgebrochen
+        seen_names = set()
+        for course in courses:
+            if course.name in seen_names:
+                log.info("Doppelte Kurse wurden entfernt.")
+                QMessageBox.warning(parent, "Der Kurs existiert bereits", "Einige doppelte Kurse wurden entfernt.")
+                return False  # Speichern wird nicht durchgeführt, weil doppelte Einträge existierten
+            seen_names.add(course.name)
+
+        # Unveränderte Kurse müssen nicht erneut geschrieben werden
+        content_hash = CourseManager.content_hash(courses)
+        if content_hash == CourseManager._last_hash:
+            log.info("Kurse unverändert - Speichern übersprungen.")
+            return True
 
-        # Überprüfung, ob doppelte Kurse entfernt wurden
-        if len(existing_courses) < len(courses):
-            log.info("Doppelte Kurse wurden entfernt.")
-            QMessageBox.warning(parent, "Der Kurs existiert bereits", "Einige doppelte Kurse wurden entfernt.")
-            return False  # Speichern wird nicht durchgeführt, weil doppelte Einträge existierten
+        # Kursdaten vormerken, geschrieben wird gesammelt durch _flush_if_dirty
+        _course_state['data'] = [course.to_dict() for course in courses]
+        _course_state['dirty'] = True
+        CourseManager._cache = list(courses)
+        CourseManager._last_hash = content_hash
+        return True
 
-        # Speichern der Kursdaten in die JSON-Datei
-        with open(CourseManager.FILE_PATH, "w") as file:
-            json.dump([course.to_dict() for course in existing_courses.values()], file)
-            return True
-            log.info(" Neuer Kurs wurde angelegt")
+    @staticmethod
+    def content_hash(courses):
+        """
+        Berechnet einen Hash über alle gespeicherten Felder der übergebenen Kurse.
+
+        Args:
+            courses (list of Course): Eine Liste von `Course`-Objekten.
+
+        Returns:
+            int: Der Hash-Wert des Kursinhalts.
+        """
+        return hash(tuple((course.name, course.ects, course.grade, course.target_grade, course.semester)
+                          for course in courses))
 
     @staticmethod
     def load_courses():
@@ -219,46 +434,155 @@ class CourseManager:
         Lädt gespeicherte Kurse aus der JSON-Datei.
 
         Falls die Datei nicht existiert oder fehlerhaft ist, wird eine leere Datei erstellt.
+        Die Datei wird nur einmal gelesen, danach wird eine Kopie des Zwischenspeichers geliefert.
 
         Returns:
             list of Course: Eine Liste der geladenen `Course`-Objekte.
         """
+        if CourseManager._cache is not None:
+            return list(CourseManager._cache)
+
         try:
             # Aufruf und auslesen aus der Kursdatei
-            with open(CourseManager.FILE_PATH, "r") as file:
-                courses = [Course.from_dict(data) for data in json.load(file)]
-                log.info("%d Kurse erfolgreich geladen.", len(courses))
-                return courses
-
-        except (FileNotFoundError, json.JSONDecodeError):
+            with open(CourseManager.FILE_PATH, "rb", buffering=IO_BUFFER_SIZE) as file:
+                data = file.read()
+            courses = list(map(Course.from_dict, json_loads(data)))
+            log.info("%d Kurse erfolgreich geladen.", len(courses))
+            CourseManager._cache = courses
+            CourseManager._last_hash = CourseManager.content_hash(courses)
+            return list(courses)
+
+        except (FileNotFoundError, JSONDecodeError):
             log.info("Kursdatei nicht gefunden - wird erstellt.")
 
-            # Erstelle eine neue leere Datei
-            with open(CourseManager.FILE_PATH, "w") as file:
-                json.dump("", file)
-                log.info("Kursdatei wurde erstellt.")
+            # Erstelle eine neue Datei mit einer leeren Kursliste
+            write_atomic(CourseManager.FILE_PATH, b"[]")
+            log.info("Kursdatei wurde erstellt.")
+            CourseManager._cache = []
+            CourseManager._last_hash = CourseManager.content_hash([])
             return []
 
+    @classmethod
+    def invalidate(cls):
+        """
+        Verwirft den Zwischenspeicher, sodass der nächste Aufruf von `load_courses` die Datei neu liest.
+        """
+        cls._cache = None
+
+    # Sortierschlüssel eines Kurses: zuerst das Semester, bei Gleichstand der Name
+    sort_key = staticmethod(operator.attrgetter("semester", "name"))
+
     @staticmethod
     def sort_courses_by_semester(courses):
         """
-        Sortiert eine Liste von Kursen basierend auf dem Semester.
+        Sortiert eine Liste von Kursen direkt (ohne neue Liste) nach dem Semester, bei Gleichstand nach dem Namen.
 
         Args:
             courses (list of Course): Eine Liste von `Course`-Objekten.
+        """
+        courses.sort(key=CourseManager.sort_key)
+
+
+class CourseTableModel(QAbstractTableModel):
+    """
+    Tabellenmodell, das die Kursliste des Dashboards direkt für eine `QTableView` bereitstellt.
+
+    Das Modell hält eine Referenz auf die Kursliste und erzeugt keine eigenen Zellobjekte.
+    Qt fragt die Werte über `data` nur für die tatsächlich sichtbaren Zellen ab.
+    """
+    HEADERS = ["Name", "ECTS", "Note", "Zielnote", "Semester"]
+
+    def __init__(self, courses):
+        """
+        Initialisiert das Modell mit der anzuzeigenden Kursliste.
+
+        Args:
+            courses (list of Course): Die Kursliste, die das Modell anzeigt und verändert.
+        """
+        super().__init__()
+        self._courses = courses
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._courses)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """
+        Liefert den Anzeigewert einer Zelle. Für alle anderen Rollen wird None zurückgegeben.
+        """
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return self._courses[index.row()].cells[index.column()]
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def replace_course(self, row, course):
+        """
+        Ersetzt den Kurs in der angegebenen Zeile, ohne dessen Position zu verändern.
+
+        Die Ansicht wird nur über die Spalten benachrichtigt, deren Anzeigewert sich tatsächlich
+        geändert hat. Bleiben alle Werte gleich, wird kein Signal gesendet.
+
+        Args:
+            row (int): Die Zeile des zu ersetzenden Kurses.
+            course (Course): Der neue Kurs.
+        """
+        old_cells = self._courses[row].cells
+        self._courses[row] = course
+        changed = [column for column, (old, new) in enumerate(zip(old_cells, course.cells)) if old != new]
+        if changed:
+            self.dataChanged.emit(self.index(row, changed[0]), self.index(row, changed[-1]))
+
+    def reset_courses(self, courses):
+        """
+        Ersetzt den Inhalt der Kursliste vollständig, ohne die Liste selbst auszutauschen.
+
+        Args:
+            courses (list of Course): Die neuen Kurse.
+        """
+        self.beginResetModel()
+        self._courses[:] = courses
+        self.endResetModel()
+
+    def insert_course(self, row, course):
+        """
+        Fügt einen Kurs an der angegebenen Position in die Kursliste ein.
+
+        Args:
+            row (int): Die Zeile, an der der Kurs eingefügt wird.
+            course (Course): Der neue Kurs.
+        """
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._courses.insert(row, course)
+        self.endInsertRows()
+
+    def remove_course(self, row):
+        """
+        Entfernt den Kurs an der angegebenen Position aus der Kursliste.
+
+        Args:
+            row (int): Die Zeile des zu entfernenden Kurses.
 
         Returns:
-            list of Course: Eine nach Semestern sortierte Liste von Kursen.
+            Course: Der entfernte Kurs.
         """
-        return sorted(courses, key=lambda course: course.semester)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        course = self._courses.pop(row)
+        self.endRemoveRows()
+        return course
 
 
 class AddCourseDialog(QDialog):
 
-    def __init__(self):
+    def __init__(self, config):
         super().__init__()
 
-        self.config = StudyConfig()
+        self.config = config
 
         self.setWindowTitle("Neues Modul hinzufügen")
         layout = QVBoxLayout()
@@ -289,6 +613,17 @@ class AddCourseDialog(QDialog):
 
         self.setLayout(layout)
 
+    def reset(self):
+        """
+        Setzt alle Eingabefelder zurück, damit der Dialog für einen weiteren Kurs wiederverwendet werden kann.
+        """
+        self.name_input.clear()
+        self.ects_input.setValue(self.ects_input.minimum())
+        self.target_grade_input.setValue(self.target_grade_input.minimum())
+        self.semester_input.setValue(self.semester_input.minimum())
+        # Ein wiederverwendeter Dialog behält sonst den Fokus vom letzten Öffnen (z. B. auf dem Button)
+        self.name_input.setFocus()
+
     def get_course(self):
         return Course(
             self.name_input.text(),
@@ -307,15 +642,18 @@ class EditCourseDialog(QDialog):
     Der Dialog übernimmt außerdem die maximale Semesteranzahl aus der `StudyConfig`.
     """
 
-    def __init__(self, course):
+    def __init__(self, config, course=None):
         """
         Initialisiert den Dialog zur Eingabe eines neuen Kurses.
         Erstellt die notwendigen Eingabefelder und einen "Hinzufügen"-Button.
+
+        Args:
+            config (StudyConfig): Die Studienkonfiguration des Dashboards (z. B. maximale Studienzeit).
+            course (Course, optional): Ein Kurs, mit dessen Werten die Felder vorbelegt werden.
         """
         super().__init__()
 
-        # Lade die Studienkonfiguration (z. B. maximale Studienzeit)
-        self.config = StudyConfig()
+        self.config = config
 
         self.setWindowTitle("Modul bearbeiten")
         self.layout = QVBoxLayout()
@@ -340,12 +678,7 @@ class EditCourseDialog(QDialog):
                                      self.config.target_time * 2)  # Die maximale Semesterzahl ist doppelt so hoch wie die Studienzeit in Jahren
 
         if course:
-            self.name_input.setText(course.name)
-            self.ects_input.setValue(course.ects)
-            if course.grade:
-                self.grade_input.setValue(course.grade)
-            self.target_grade_input.setValue(course.target_grade)
-            self.semester_input.setValue(course.semester)
+            self.populate(course)
 
         # Zu weisen der einzelnen input felder zu dem widget
         self.layout.addWidget(QLabel("Kursname:"))
@@ -366,6 +699,24 @@ class EditCourseDialog(QDialog):
 
         self.setLayout(self.layout)
 
+    def populate(self, course):
+        """
+        Belegt die vorhandenen Eingabefelder mit den Werten eines Kurses.
+
+        Dadurch kann derselbe Dialog für verschiedene Kurse wiederverwendet werden.
+
+        Args:
+            course (Course): Der zu bearbeitende Kurs.
+        """
+        self.name_input.setText(course.name)
+        self.ects_input.setValue(course.ects)
+        self.grade_input.setValue(course.grade or 0.0)
+        self.target_grade_input.setValue(course.target_grade)
+        self.semester_input.setValue(course.semester)
+        # Fokus zurück auf den Namen setzen, da der Dialog seinen Fokus vom letzten Öffnen behält
+        self.name_input.setFocus()
+        self.name_input.selectAll()
+
     def get_course(self):
         """
         Erstellt ein `Course`-Objekt aus den eingegebenen Daten.
@@ -394,13 +745,42 @@ class Dashboard(QWidget):
         """
         Initialisiert das Dashboard.
 
-        Lädt die gespeicherten Kurse und die Konfiguration und rendert die Benutzeroberfläche.
+        Lädt die Konfiguration und rendert die Benutzeroberfläche. Die gespeicherten Kurse werden
+        im Hintergrund geladen und nach dem Laden in `_on_courses_loaded` übernommen.
         """
         super().__init__()
         self.config = StudyConfig() # Lade die Studienkonfiguration
-        self.courses = CourseManager.load_courses() # Lade die gespeicherten Kurse
+        # Die Kursliste wird nach dem Laden bei jeder Änderung sortiert gehalten
+        self.courses = []
+        self._course_names = set() # Namen aller Kurse für die Duplikatprüfung
+        self._add_dialog = None # Wird beim ersten Öffnen erstellt und danach wiederverwendet
+        self._edit_dialog = None # Wird beim ersten Öffnen erstellt und danach wiederverwendet
+        self.refresh_arrays() # Baue die Spalten-Arrays für die Auswertungen auf
         self.render() # Erstelle die Benutzeroberfläche
 
+        # Lade die gespeicherten Kurse im Thread-Pool
+        worker = CourseIOWorker()
+        worker.signals.loaded.connect(self._on_courses_loaded)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_courses_loaded(self, courses):
+        """
+        Übernimmt die im Hintergrund geladenen Kurse und aktualisiert Tabelle und Diagramme.
+
+        Args:
+            courses (list of Course): Die geladenen Kurse.
+        """
+        # Vor dem Zurücksetzen des Modells sortieren, damit die Ansicht direkt die fertige Reihenfolge erhält
+        CourseManager.sort_courses_by_semester(courses)
+        self.course_model.reset_courses(courses)
+        self._course_names = {course.name for course in self.courses}
+        self.refresh_arrays()
+        self.update_burndown_chart()
+        self.update_chart()
+        # Erst jetzt dürfen Kurse verändert werden, sonst würde das Laden die Änderungen überschreiben
+        self.add_course_button.setEnabled(True)
+        self.edit_course_button.setEnabled(True)
+
 
     def render(self):
         """
@@ -410,7 +790,8 @@ class Dashboard(QWidget):
         """
 
         # Setzt das Fenster auf die Bildschirmgröße
-        self.setGeometry(0, 0, GetSystemMetrics(0), GetSystemMetrics(1))
+        screen_geometry = QGuiApplication.primaryScreen().availableGeometry()
+        self.setGeometry(screen_geometry)
 
         self.setWindowTitle("ECTS & Abschlussnote Dashboard")
 
@@ -418,42 +799,94 @@ class Dashboard(QWidget):
         info_layout = QVBoxLayout()
         content_layout = QHBoxLayout()
 
-        # Anzeige der Konfigurationswerte
-        info_layout.addWidget(QLabel(f"Zielzeit: {self.config.target_time} Jahre"))
-        info_layout.addWidget(QLabel(f"Zielsemester: {self.config.target_time * 2} Semeseter"))
-        info_layout.addWidget(QLabel(f"Zielnote: {self.config.target_grade}"))
+        # Anzeige der Konfigurationswerte in einem gemeinsamen Label
+        self._info_label = QLabel(f"Zielzeit: {self.config.target_time} Jahre\n"
+                                  f"Zielsemester: {self.config.target_time * 2} Semester\n"
+                                  f"Zielnote: {self.config.target_grade}")
+        info_layout.addWidget(self._info_label)
 
         # Buttons für Kursverwaltung
         self.add_course_button = QPushButton("Modul hinzufügen")
         self.add_course_button.clicked.connect(self.add_course)
+        self.add_course_button.setEnabled(False) # Wird freigegeben, sobald die Kurse geladen sind
         info_layout.addWidget(self.add_course_button)
 
         self.edit_course_button = QPushButton("Modul bearbeiten")
         self.edit_course_button.clicked.connect(self.edit_course)
+        self.edit_course_button.setEnabled(False) # Wird freigegeben, sobald die Kurse geladen sind
         info_layout.addWidget(self.edit_course_button)
 
-        # Tabelle zur Anzeige der Kurse
-        self.course_table = QTableWidget()
-        self.course_table.setColumnCount(5)
-        self.course_table.setHorizontalHeaderLabels(["Name", "ECTS", "Note", "Zielnote", "Semester"])
+        # Tabelle zur Anzeige der Kurse, die Daten liefert das Modell direkt aus self.courses
+        self.course_model = CourseTableModel(self.courses)
+        self.course_table = QTableView()
+        self.course_table.setModel(self.course_model)
+        # Feste Spaltenbreiten und Zeilenhöhen, damit Qt nie alle Zellinhalte zur Größenbestimmung ausmisst
+        self.course_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.course_table.horizontalHeader().setDefaultSectionSize(120)
+        self.course_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.course_table.verticalHeader().setDefaultSectionSize(22)
         content_layout.addWidget(self.course_table)
 
         # Diagramm für Notenübersicht
-        self.canvas = FigureCanvas(plt.figure())
+        self.canvas = self._make_canvas()
         content_layout.addWidget(self.canvas)
 
         # Burndown-Diagramm für ECTS-Fortschritt
-        self.burndown_canvas = FigureCanvas(plt.figure())
+        self.burndown_canvas = self._make_canvas()
         content_layout.addWidget(self.burndown_canvas)
 
+        # Achsen und Diagrammelemente werden einmalig angelegt und danach nur noch mit neuen Daten versorgt
+        self._ax = self.canvas.figure.add_subplot(111)
+        self._bar = self._ax.bar(["Aktuelle Note"], [0], color='blue', label="Durchschnittsnote")[0]
+        self._target_line = self._ax.axhline(self.config.target_grade, color='red', linestyle='dashed',
+                                             label="Zielnote")
+        self._ax.set_ylabel("Note")
+        # Die Notenskala ist fest, daher werden die Grenzen einmalig gesetzt statt neu berechnet
+        self._ax.set_autoscale_on(False)
+        self._ax.set_ylim(0, 5.0)
+        self._ax.legend()
+        self._drawn_avg_grade = None # Zuletzt gezeichnete Durchschnittsnote
+
+        self._bd_ax = self.burndown_canvas.figure.add_subplot(111)
+        self._ects_line, = self._bd_ax.plot([], [], marker='o', linestyle='-', color='blue',
+                                            label="Verbleibende ECTS (tatsächlich)")
+        self._optimal_line, = self._bd_ax.plot([], [], linestyle='dashed', color='red',
+                                               label="Optimale Burndown-Linie")
+        self._average_line, = self._bd_ax.plot([], [], linestyle='-', color='green',
+                                               label="Durchschnittliche Abbrennrate")
+        self._bd_ax.set_xlabel("Semester")
+        self._bd_ax.set_ylabel("Verbleibende ECTS")
+        self._bd_ax.set_title("ECTS Burndown Chart")
+        # Die Grenzen werden in update_burndown_chart direkt aus den Eingaben berechnet
+        self._bd_ax.set_autoscale_on(False)
+        self._bd_ax.legend()
+        self._drawn_burndown_inputs = None # Zuletzt gezeichnete Eingaben (Ziel-ECTS, erreichte ECTS, Semester)
+
         main_layout.addLayout(info_layout)
         main_layout.addLayout(content_layout)
         self.setLayout(main_layout)
 
-        # Initialisiere Diagramme und Tabelle
+        # Initialisiere Diagramme
         self.update_chart()
         self.update_burndown_chart()
-        self.update_table()
+
+    def _make_canvas(self):
+        """
+        Erstellt eine Zeichenfläche für ein Diagramm.
+
+        matplotlib wird erst hier geladen, damit der Programmstart nicht auf den Import warten muss.
+        Die Figur wird direkt erzeugt und nicht über `pyplot` verwaltet, eine automatische
+        Layout-Engine ist ausgeschaltet.
+
+        Returns:
+            FigureCanvasQTAgg: Eine Qt-Zeichenfläche mit einer leeren Figur.
+        """
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+        figure = Figure()
+        # Kein Layout-Durchlauf bei jedem Neuzeichnen, es werden nur die geänderten Elemente gezeichnet
+        figure.set_layout_engine("none")
+        return FigureCanvasQTAgg(figure)
 
     def edit_course(self):
         """
@@ -461,122 +894,155 @@ class Dashboard(QWidget):
 
           Falls kein Kurs ausgewählt wurde, erscheint eine Warnmeldung.
           """
-        selected_row = self.course_table.currentRow()
-        print(selected_row)
+        selected_row = self.course_table.currentIndex().row()
         if selected_row == -1:
             QMessageBox.warning(self, "Keine Auswahl", "Bitte wählen Sie einen Kurs zum Bearbeiten aus.")
             return
 
         course = self.courses[selected_row]
-        dialog = EditCourseDialog(course)
+        if self._edit_dialog is None:
+            self._edit_dialog = EditCourseDialog(self.config)
+        dialog = self._edit_dialog
+        dialog.populate(course)
         if dialog.exec():
-            self.courses[selected_row] = dialog.get_course()
-            CourseManager.save_courses(self.courses, self)
-            self.update_table()
+            edited_course = dialog.get_course()
+            if edited_course.name != course.name and edited_course.name in self._course_names:
+                QMessageBox.warning(self, "Der Kurs existiert bereits", "Ein Kurs mit diesem Namen ist bereits vorhanden.")
+                return
+            self._course_names.discard(course.name)
+            self._course_names.add(edited_course.name)
+            new_key = CourseManager.sort_key(edited_course)
+            fits_before = selected_row == 0 or CourseManager.sort_key(self.courses[selected_row - 1]) <= new_key
+            fits_after = (selected_row + 1 == len(self.courses)
+                          or new_key < CourseManager.sort_key(self.courses[selected_row + 1]))
+            if fits_before and fits_after:
+                # Die Position bleibt gleich, daher werden nur die geänderten Zellen neu angezeigt
+                self.course_model.replace_course(selected_row, edited_course)
+                new_row = selected_row
+            else:
+                # Kurs entfernen und an der passenden Stelle wieder einsortieren
+                self.course_model.remove_course(selected_row)
+                new_row = self._insert_position(new_key)
+                self.course_model.insert_course(new_row, edited_course)
+                self.course_table.selectRow(new_row)
+            if not CourseManager.save_courses(self.courses, self):
+                # Nicht gespeicherte Änderung zurücknehmen, damit Tabelle und Datei übereinstimmen
+                if new_row == selected_row:
+                    self.course_model.replace_course(selected_row, course)
+                else:
+                    self.course_model.remove_course(new_row)
+                    self.course_model.insert_course(selected_row, course)
+                    self.course_table.selectRow(selected_row)
+                self._course_names.discard(edited_course.name)
+                self._course_names.add(course.name)
+                return
+            self.refresh_arrays()
             self.update_burndown_chart()
             self.update_chart()
             log.info("Kurs bearbeitet: %s", course.name)
 
-    def update_table(self):
+    def _insert_position(self, key):
         """
-        Aktualisiert die Tabelle mit den gespeicherten Kursen.
+        Ermittelt per binärer Suche die Zeile, an der ein Kurs mit dem angegebenen Sortierschlüssel
+        eingefügt werden muss, damit die Kursliste sortiert bleibt.
 
-        Berechnet außerdem die Durchschnittsnote (GPA) der abgeschlossenen Kurse.
+        Args:
+            key (tuple): Der Sortierschlüssel (Semester, Name) des einzufügenden Kurses.
+
+        Returns:
+            int: Die Einfügeposition in `self.courses`.
         """
-        self.courses = CourseManager.sort_courses_by_semester(self.courses)
-        self.course_table.setRowCount(len(self.courses))
+        # bisect unterstützt den key-Parameter erst ab Python 3.10, daher eine Liste der Schlüssel
+        keys = [CourseManager.sort_key(course) for course in self.courses]
+        return bisect.bisect_right(keys, key)
 
-        total_weighted = sum(course.ects * (course.grade or 0) for course in self.courses if course.grade is not None)
-        total_ects = sum(course.ects for course in self.courses if course.grade != 0)
-        gpa = round(total_weighted / total_ects, 2) if total_ects else "N/A"
+    def refresh_arrays(self):
+        """
+        Legt ECTS-Punkte und Noten aller Kurse als parallele NumPy-Arrays ab.
 
-        for row, course in enumerate(self.courses):
-            self.course_table.setItem(row, 0, QTableWidgetItem(course.name))
-            self.course_table.setItem(row, 1, QTableWidgetItem(str(course.ects)))
-            self.course_table.setItem(row, 2,
-                                      QTableWidgetItem(str(course.grade) if course.grade != 0 else "N/A"))
-            self.course_table.setItem(row, 3, QTableWidgetItem(str(course.target_grade)))
-            self.course_table.setItem(row, 4, QTableWidgetItem(str(course.semester)))
+        Die Arrays werden nach jeder Änderung an `self.courses` neu aufgebaut, damit
+        Summen und Durchschnitte vektorisiert berechnet werden können.
+        """
+        count = len(self.courses)
+        self._ects = np.fromiter((course.ects for course in self.courses), dtype=np.int32, count=count)
+        self._grades = np.fromiter((course.grade or 0.0 for course in self.courses), dtype=np.float64, count=count)
+        # Entspricht Course.is_completed() für alle Kurse auf einmal
+        self._completed_mask = (self._grades >= 1) & (self._grades <= 4)
 
     def update_chart(self):
         """
-        Erstellt ein Balkendiagramm, das die aktuelle Durchschnittsnote mit der Zielnote vergleicht.
+        Aktualisiert das Balkendiagramm, das die aktuelle Durchschnittsnote mit der Zielnote vergleicht.
         """
-        grades = [course.grade for course in self.courses if course.grade]
-        if grades:
-            avg_grade = sum(grades) / len(grades)
-        else:
-            avg_grade = 0
+        grades = self._grades[self._grades > 0]
+        avg_grade = float(grades.mean()) if grades.size else 0
+        if avg_grade == self._drawn_avg_grade:
+            return  # Die Noten haben sich nicht geändert, ein Neuzeichnen ist nicht nötig
+        self._drawn_avg_grade = avg_grade
 
-        self.canvas.figure.clear()
-        ax = self.canvas.figure.add_subplot(111)
-        ax.bar(["Aktuelle Note"], [avg_grade], color='blue', label="Durchschnittsnote")
-        ax.axhline(self.config.target_grade, color='red', linestyle='dashed', label="Zielnote")
-
-        ax.set_ylabel("Note")
-        ax.legend()
-        self.canvas.draw()
+        # Nur die Höhe des vorhandenen Balkens wird angepasst, die Achsen bleiben bestehen
+        self._bar.set_height(avg_grade)
+        self.canvas.draw_idle()
 
     def update_burndown_chart(self):
         """
-        Erstellt ein Burndown-Chart, das den verbleibenden ECTS-Fortschritt darstellt.
+        Aktualisiert das Burndown-Chart, das den verbleibenden ECTS-Fortschritt darstellt.
         """
-        target_ects = sum(course.ects for course in self.courses)
-
-        time_periods = list(range(1, self.config.target_time * 2 + 1))
-
-        ects_progress = []
-        optimal_progress = []
-        average_burn_rate = []
-
-        optimal_progress.append(target_ects)
-        ects_progress.append(target_ects)
-        average_burn_rate.append(target_ects)
-
-        earned_ects = sum(course.ects for course in self.courses if course.is_completed())
-        remaining_ects = target_ects - earned_ects
+        target_ects = int(self._ects.sum())
 
+        # Semester 1 bis Zielsemester, jeweils als Index für die Fortschrittslinien
+        time_periods = np.arange(1, self.config.target_time * 2 + 1)
         total_time = len(time_periods)
-        if total_time > 1:
-            average_rate = (target_ects - remaining_ects) / (total_time - 1)
 
-        for i in range(1, total_time + 1):
-
-            if i <= len(time_periods):
-                ects_progress.append(target_ects - i * (earned_ects / total_time))
-                optimal_progress.append(target_ects - (target_ects / total_time) * i)
-                average_burn_rate.append(target_ects - i * average_rate)
-
-        self.burndown_canvas.figure.clear()
-        ax = self.burndown_canvas.figure.add_subplot(111)
-
-        ax.plot(time_periods, ects_progress[:len(time_periods)], marker='o', linestyle='-', color='blue',
-                label="Verbleibende ECTS (tatsächlich)")
-
-        ax.plot(time_periods, optimal_progress[:len(time_periods)], linestyle='dashed', color='red',
-                label="Optimale Burndown-Linie")
-
-        ax.plot(time_periods, average_burn_rate[:len(time_periods)], linestyle='-', color='green',
-                label="Durchschnittliche Abbrennrate")
-
-        ax.set_xlabel("Semester")
-        ax.set_ylabel("Verbleibende ECTS")
-        ax.set_title("ECTS Burndown Chart")
-        ax.legend()
-        self.burndown_canvas.draw()
+        earned_ects = int(self._ects[self._completed_mask].sum())
+        inputs = (target_ects, earned_ects, total_time)
+        if inputs == self._drawn_burndown_inputs:
+            return  # ECTS und bestandene Kurse sind unverändert, ein Neuzeichnen ist nicht nötig
+        self._drawn_burndown_inputs = inputs
+
+        earned_rate = earned_ects / total_time if total_time else 0.0
+        optimal_rate = target_ects / total_time if total_time else 0.0
+        average_rate = earned_ects / (total_time - 1) if total_time > 1 else 0.0
+
+        # Alle drei Linien werden in einem Schritt über alle Semester berechnet
+        ects_progress = target_ects - time_periods * earned_rate
+        optimal_progress = target_ects - time_periods * optimal_rate
+        average_burn_rate = target_ects - time_periods * average_rate
+
+        # Nur die Daten der vorhandenen Linien werden ersetzt, die Achsen bleiben bestehen
+        self._ects_line.set_data(time_periods, ects_progress)
+        self._optimal_line.set_data(time_periods, optimal_progress)
+        self._average_line.set_data(time_periods, average_burn_rate)
+        # Alle Linien fallen linear, der kleinste Wert liegt daher jeweils im letzten Semester
+        y_min = min(0.0, float(ects_progress[-1]), float(average_burn_rate[-1])) if total_time else 0.0
+        y_margin = max(target_ects - y_min, 1) * 0.05
+        self._bd_ax.set_xlim(0.5, total_time + 0.5)
+        self._bd_ax.set_ylim(y_min - y_margin, target_ects + y_margin)
+        self.burndown_canvas.draw_idle()
 
     def add_course(self):
         """
         Öffnet den `AddCourseDialog`, um einen neuen Kurs hinzuzufügen.
         """
-        dialog = AddCourseDialog()
+        if self._add_dialog is None:
+            self._add_dialog = AddCourseDialog(self.config)
+        dialog = self._add_dialog
+        dialog.reset()
         if dialog.exec():
             new_course = dialog.get_course()
-            self.courses.append(new_course)
-            is_saved_successful = CourseManager.save_courses(self.courses, self)
-            if not is_saved_successful:
-                del self.courses[-1]
-            self.update_table()
+            if new_course.name in self._course_names:
+                QMessageBox.warning(self, "Der Kurs existiert bereits", "Ein Kurs mit diesem Namen ist bereits vorhanden.")
+                return
+            # Binäre Suche nach der Einfügeposition, damit die Liste sortiert bleibt
+            row = self._insert_position(CourseManager.sort_key(new_course))
+            self.course_model.insert_course(row, new_course)
+            self._course_names.add(new_course.name)
+            if not CourseManager.save_courses(self.courses, self):
+                # Nicht gespeicherten Kurs wieder entfernen, damit Tabelle und Datei übereinstimmen
+                self.course_model.remove_course(row)
+                self._course_names.discard(new_course.name)
+                return
+            log.info("Neuer Kurs wurde angelegt: %s", new_course.name)
+            self.refresh_arrays()
             self.update_burndown_chart()
             self.update_chart()
 
@@ -586,24 +1052,43 @@ def main():
     Startet die Dashboard-Anwendung.
 
     - Erstellt das erforderliche Log-Verzeichnis, falls es nicht existiert.
-    - Initialisiert das Logging-System zur Fehler- und Ereignisprotokollierung.
+    - Initialisiert das Logging-System zur Fehler- und Ereignisprotokollierung. Die Log-Datei wird
+      von einem Hintergrund-Thread geschrieben, damit die Oberfläche nicht auf Dateizugriffe wartet.
     - Startet die PyQt6-Anwendung und zeigt das Dashboard-Fenster an.
     """
-    # Prüfe, ob das Log-Verzeichnis existiert, und erstelle es falls notwendig
-    if not os.path.exists("save/log"):
-        os.makedirs("save/log")
-
-    # Initialisiere das Logging-System
-    log.basicConfig(filename='save/log/dashboard.log', level=log.INFO,
-                    format='%(asctime)s - %(levelname)s - %(message)s')
+    # Erstelle das Log-Verzeichnis, falls es noch nicht existiert
+    Path("save/log").mkdir(parents=True, exist_ok=True)
+
+    # Initialisiere das Logging-System: Log-Aufrufe landen in einer Queue, der Listener schreibt sie in die Datei
+    log_queue = queue.SimpleQueue()
+    file_handler = log.FileHandler('save/log/dashboard.log')
+    file_handler.setFormatter(log.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    listener = QueueListener(log_queue, file_handler)
+    # Die QueueHandler übergibt nur die Nachricht, formatiert wird ausschließlich vom FileHandler
+    log.basicConfig(level=log.INFO, format='%(message)s', handlers=[QueueHandler(log_queue)])
+    listener.start()
 
     # Erstelle die PyQt6-Anwendung
     app = QApplication(sys.argv)
+
+    # Geänderte Kurse und Konfiguration werden alle zwei Sekunden gesammelt geschrieben,
+    # spätestens aber beim Beenden der Anwendung
+    atexit.register(_flush_if_dirty)
+    flush_timer = QTimer()
+    flush_timer.timeout.connect(_schedule_flush)
+    flush_timer.start(2000)
+
     # Initialisiere und zeige das Dashboard
     dashboard = Dashboard()
     dashboard.show()
     # Starte die Ereignisschleife der Anwendung
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    # Warte auf laufende Hintergrundaufgaben und schreibe dann ausstehende Änderungen
+    # und alle noch ausstehenden Log-Einträge, bevor die Anwendung beendet wird
+    QThreadPool.globalInstance().waitForDone()
+    _flush_if_dirty()
+    listener.stop()
+    sys.exit(exit_code)
 
 # Überprüft, ob das Skript direkt ausgeführt wird
 if __name__ == "__main__":